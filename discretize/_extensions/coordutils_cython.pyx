@@ -0,0 +1,101 @@
+# cython: embedsignature=True, language_level=3
+# cython: linetrace=True
+cimport cython
+from cython cimport floating
+from libc.math cimport sin, cos, hypot, atan2, isinf
+
+# These kernels loop over contiguous rows with no reductions, so the inner loops
+# are left for the C compiler to vectorize. Each is generated for both float32
+# and float64 arrays. Bounds checking is disabled inside the loops, so the
+# array shapes are validated up front.
+
+cdef int _check_shape(str name, Py_ssize_t rows, Py_ssize_t cols, Py_ssize_t n) except -1:
+    if rows != n or cols != 3:
+        raise ValueError(f"{name} must have shape ({n}, 3), not ({rows}, {cols})")
+    return 0
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.nonecheck(False)
+def _cyl2cart_pts(const floating[:, ::1] grid, floating[:, ::1] out):
+    cdef Py_ssize_t i
+    cdef floating r, t
+    cdef Py_ssize_t n = grid.shape[0]
+    _check_shape("grid", grid.shape[0], grid.shape[1], n)
+    _check_shape("out", out.shape[0], out.shape[1], n)
+    with nogil:
+        for i in range(n):
+            r = grid[i, 0]
+            t = grid[i, 1]
+            out[i, 0] = r * cos(t)
+            out[i, 1] = r * sin(t)
+            out[i, 2] = grid[i, 2]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.nonecheck(False)
+def _cyl2cart_vec(const floating[:, ::1] grid, const floating[:, ::1] vec, floating[:, ::1] out):
+    cdef Py_ssize_t i
+    cdef floating c, s, v_r, v_t
+    cdef Py_ssize_t n = grid.shape[0]
+    _check_shape("grid", grid.shape[0], grid.shape[1], n)
+    _check_shape("vec", vec.shape[0], vec.shape[1], n)
+    _check_shape("out", out.shape[0], out.shape[1], n)
+    with nogil:
+        for i in range(n):
+            c = cos(grid[i, 1])
+            s = sin(grid[i, 1])
+            v_r = vec[i, 0]
+            v_t = vec[i, 1]
+            out[i, 0] = v_r * c - v_t * s
+            out[i, 1] = v_r * s + v_t * c
+            out[i, 2] = vec[i, 2]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.nonecheck(False)
+def _cart2cyl_pts(const floating[:, ::1] grid, floating[:, ::1] out):
+    cdef Py_ssize_t i
+    cdef floating x, y
+    cdef Py_ssize_t n = grid.shape[0]
+    _check_shape("grid", grid.shape[0], grid.shape[1], n)
+    _check_shape("out", out.shape[0], out.shape[1], n)
+    with nogil:
+        for i in range(n):
+            x = grid[i, 0]
+            y = grid[i, 1]
+            out[i, 0] = hypot(x, y)
+            out[i, 1] = atan2(y, x)
+            out[i, 2] = grid[i, 2]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.nonecheck(False)
+@cython.cdivision(True)
+def _cart2cyl_vec(const floating[:, ::1] grid, const floating[:, ::1] vec, floating[:, ::1] out):
+    cdef Py_ssize_t i
+    cdef floating x, y, r, t, c, s, v_x, v_y
+    cdef Py_ssize_t n = grid.shape[0]
+    _check_shape("grid", grid.shape[0], grid.shape[1], n)
+    _check_shape("vec", vec.shape[0], vec.shape[1], n)
+    _check_shape("out", out.shape[0], out.shape[1], n)
+    with nogil:
+        for i in range(n):
+            x = grid[i, 0]
+            y = grid[i, 1]
+            r = hypot(x, y)
+            if r == 0.0:
+                c = 1.0
+                s = 0.0
+            elif isinf(r):
+                t = atan2(y, x)
+                c = cos(t)
+                s = sin(t)
+            else:
+                c = x / r
+                s = y / r
+            v_x = vec[i, 0]
+            v_y = vec[i, 1]
+            out[i, 0] = c * v_x + s * v_y
+            out[i, 1] = -s * v_x + c * v_y
+            out[i, 2] = vec[i, 2]
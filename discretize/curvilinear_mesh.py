@@ -24,11 +24,11 @@ def _length3D(x):
 
 
 def _normalize2D(x):
-    return x / np.kron(np.ones((1, 2)), mkvc(_length2D(x), 2))
+    return x / _length2D(x)[:, None]
 
 
 def _normalize3D(x):
-    return x / np.kron(np.ones((1, 3)), mkvc(_length3D(x), 2))
+    return x / _length3D(x)[:, None]
 
 
 class CurvilinearMesh(
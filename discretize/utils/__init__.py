@@ -35,6 +35,8 @@ Coordinate Transform Utilities
 
   rotate_points_from_normals
   rotation_matrix_from_normals
+  rotation_matrices_from_normals
+  compose_rotations
   cylindrical_to_cartesian
   cartesian_to_cylindrical
 
@@ -147,6 +149,8 @@ from discretize.utils.interpolation_utils import interpolation_matrix, volume_av
 from discretize.utils.coordinate_utils import (
     rotate_points_from_normals,
     rotation_matrix_from_normals,
+    rotation_matrices_from_normals,
+    compose_rotations,
     cyl2cart,
     cart2cyl,
     cylindrical_to_cartesian,
@@ -0,0 +1,69 @@
+"""Compiled kernels for the coordinate transformations.
+
+This module requires ``numba``. It is a fallback for when the cython
+extension is unavailable, and is only imported by
+:mod:`discretize.utils.coordinate_utils` the first time a transform is large
+enough to use it. Each kernel operates on C-contiguous input arrays and writes
+into a preallocated output array of the same dtype. The kernels are compiled
+lazily for each dtype on their first call, and cached on disk.
+"""
+from math import atan2, cos, hypot, isinf, sin
+
+from numba import njit, prange
+
+_opts = dict(parallel=True, cache=True)
+
+
+@njit(**_opts)
+def _cyl2cart_pts(grid, out):
+    for i in prange(grid.shape[0]):
+        r = grid[i, 0]
+        t = grid[i, 1]
+        out[i, 0] = r * cos(t)
+        out[i, 1] = r * sin(t)
+        out[i, 2] = grid[i, 2]
+
+
+@njit(**_opts)
+def _cyl2cart_vec(grid, vec, out):
+    for i in prange(grid.shape[0]):
+        c = cos(grid[i, 1])
+        s = sin(grid[i, 1])
+        v_r = vec[i, 0]
+        v_t = vec[i, 1]
+        out[i, 0] = v_r * c - v_t * s
+        out[i, 1] = v_r * s + v_t * c
+        out[i, 2] = vec[i, 2]
+
+
+@njit(**_opts)
+def _cart2cyl_pts(grid, out):
+    for i in prange(grid.shape[0]):
+        x = grid[i, 0]
+        y = grid[i, 1]
+        out[i, 0] = hypot(x, y)
+        out[i, 1] = atan2(y, x)
+        out[i, 2] = grid[i, 2]
+
+
+@njit(**_opts)
+def _cart2cyl_vec(grid, vec, out):
+    for i in prange(grid.shape[0]):
+        x = grid[i, 0]
+        y = grid[i, 1]
+        r = hypot(x, y)
+        if r == 0.0:
+            c = 1.0
+            s = 0.0
+        elif isinf(r):
+            t = atan2(y, x)
+            c = cos(t)
+            s = sin(t)
+        else:
+            c = x / r
+            s = y / r
+        v_x = vec[i, 0]
+        v_y = vec[i, 1]
+        out[i, 0] = c * v_x + s * v_y
+        out[i, 1] = -s * v_x + c * v_y
+        out[i, 2] = vec[i, 2]
@@ -1,10 +1,182 @@
 """Simple utilities for coordinate transformations."""
+import importlib.util
+import math
+from functools import reduce
 import numpy as np
-from discretize.utils.matrix_utils import mkvc
 from discretize.utils.code_utils import as_array_n_by_dim, deprecate_function
 
+try:
+    from discretize._extensions import coordutils_cython
+
+    _CYTHON_AVAILABLE = True
+except ImportError:
+    _CYTHON_AVAILABLE = False
+
+# numba (and the compiled kernels) are only imported the first time they are
+# needed, see _load_numba_kernels.
+_NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+_numba_kernels = None
+
+# Below these numbers of points the numpy implementation is faster than
+# dispatching to the compiled kernels. The cython kernels are built with
+# discretize and are always preferred. The numba kernels are only a fallback for
+# when the extension is unavailable, as importing numba and loading its kernel
+# cache takes far longer than a single transform.
+_NUMBA_MIN_PTS = 8192
+_CYTHON_MIN_PTS = 1024
+
+# Number of points the numpy implementations process at a time, so that the
+# per-column temporaries (64 KiB each) stay resident in cache.
+_TILE_SIZE = 8192
+
+
+def _load_numba_kernels():
+    """Import the numba kernels on first use, or return None if unavailable."""
+    global _NUMBA_AVAILABLE, _numba_kernels
+    if _NUMBA_AVAILABLE and _numba_kernels is None:
+        try:
+            from discretize.utils import _coordinate_kernels
+        except ImportError:
+            _NUMBA_AVAILABLE = False
+        else:
+            _numba_kernels = _coordinate_kernels
+    return _numba_kernels if _NUMBA_AVAILABLE else None
+
+
+def _compiled_kernels(grid, dtype):
+    """Return the module of compiled kernels to use for grid, if any.
+
+    The kernels only handle float32 and float64, so other dtypes (e.g.
+    longdouble or complex) always use the numpy implementations.
+    """
+    if grid.shape[1] != 3 or dtype.type not in (np.float32, np.float64):
+        return None
+    if _CYTHON_AVAILABLE:
+        return coordutils_cython if grid.shape[0] > _CYTHON_MIN_PTS else None
+    if _NUMBA_AVAILABLE and grid.shape[0] >= _NUMBA_MIN_PTS:
+        return _load_numba_kernels()
+    return None
+
+
+def _result_dtype(*arrays):
+    """Floating point dtype of a transform's output.
+
+    The result is float32 only if every input is float32. Anything else, including
+    integer, boolean and float16 inputs, is computed in (at least) float64.
+    """
+    # np.result_type is slow relative to a small transform, so the common cases
+    # are checked directly
+    types = {arr.dtype.type for arr in arrays if arr is not None}
+    if types == {np.float32}:
+        return np.dtype(np.float32)
+    if types <= {np.float32, np.float64}:
+        return np.dtype(np.float64)
+    return np.result_type(*types, np.float64)
+
+
+def _cos_sin(theta, dtype):
+    """Evaluate the cosine and sine of a contiguous copy of theta."""
+    theta = np.ascontiguousarray(theta, dtype=dtype)
+    return np.cos(theta), np.sin(theta)
+
+
+def _apply_tiled(func, grid, vec, out):
+    """Apply a numpy transform over consecutive row tiles of grid, vec and out."""
+    if grid.shape[0] <= _TILE_SIZE:
+        func(grid, vec, out)
+        return out
+    for start in range(0, grid.shape[0], _TILE_SIZE):
+        tile = slice(start, start + _TILE_SIZE)
+        func(grid[tile], None if vec is None else vec[tile], out[tile])
+    return out
+
+
+def _broadcast_vec(vec, n_pts, dim):
+    """Broadcast vec against the grid points, checking that the shapes agree.
+
+    The compiled kernels do no bounds checking, so this must be done before
+    dispatching to them.
+    """
+    n_vec, n_cols = vec.shape if vec.ndim == 2 else (0, 0)
+    if n_cols < dim or n_vec not in (1, n_pts):
+        raise ValueError(f"vec must have shape ({n_pts}, {dim}), not {vec.shape}")
+    if n_cols != dim:
+        vec = vec[:, :dim]
+    if n_vec != n_pts:
+        vec = np.broadcast_to(vec, (n_pts, dim))
+    return vec
+
+
+def _prepare_out(out, shape, dtype):
+    """Allocate the output array, or validate a user supplied one."""
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if not isinstance(out, np.ndarray):
+        raise TypeError("out must be a numpy array")
+    if out.shape != shape:
+        raise ValueError(f"out must have shape {shape}, not {out.shape}")
+    if out.dtype != dtype:
+        raise ValueError(f"out must have a {dtype} dtype, not {out.dtype}")
+    return out
+
+
+# The numpy implementations below only read each input column before the output
+# column that could alias it is written, so `out` may be the same array as `grid`
+# or `vec`.
 
-def cylindrical_to_cartesian(grid, vec=None):
+
+def _cyl2cart_numpy(grid, vec, out):
+    cos_t, sin_t = _cos_sin(grid[:, 1], out.dtype)
+
+    if vec is None:
+        np.multiply(grid[:, 0], sin_t, out=out[:, 1])
+        np.multiply(grid[:, 0], cos_t, out=out[:, 0])
+        out[:, 2] = grid[:, 2]
+        return
+
+    x = np.empty(grid.shape[0], dtype=out.dtype)
+    tmp = np.empty(grid.shape[0], dtype=out.dtype)
+    # x = v_r cos(theta) - v_theta sin(theta)
+    np.multiply(vec[:, 0], cos_t, out=x)
+    np.multiply(vec[:, 1], sin_t, out=tmp)
+    np.subtract(x, tmp, out=x)
+    # y = v_r sin(theta) + v_theta cos(theta)
+    np.multiply(vec[:, 0], sin_t, out=tmp)
+    np.multiply(vec[:, 1], cos_t, out=out[:, 1])
+    np.add(out[:, 1], tmp, out=out[:, 1])
+    out[:, 0] = x
+    if grid.shape[1] == 3:
+        out[:, 2] = vec[:, 2]
+
+
+def _cart2cyl_numpy(grid, vec, out):
+    if vec is None:
+        r = np.hypot(grid[:, 0], grid[:, 1], dtype=out.dtype)
+        np.arctan2(grid[:, 1], grid[:, 0], out=out[:, 1], dtype=out.dtype)
+        out[:, 0] = r
+        out[:, 2] = grid[:, 2]
+        return
+
+    # The compiled kernels use cos(theta) = x / r and sin(theta) = y / r, but with
+    # numpy the masking that ratio needs on the axis and at infinity costs more
+    # than the trig it saves.
+    theta = np.arctan2(grid[:, 1], grid[:, 0], dtype=out.dtype)
+    cos_t, sin_t = _cos_sin(theta, out.dtype)
+    v_r = theta  # reuse the buffer
+    tmp = np.empty(grid.shape[0], dtype=out.dtype)
+    # v_r = v_x cos(theta) + v_y sin(theta)
+    np.multiply(vec[:, 0], cos_t, out=v_r)
+    np.multiply(vec[:, 1], sin_t, out=tmp)
+    np.add(v_r, tmp, out=v_r)
+    # v_theta = -v_x sin(theta) + v_y cos(theta)
+    np.multiply(vec[:, 0], sin_t, out=tmp)
+    np.multiply(vec[:, 1], cos_t, out=out[:, 1])
+    np.subtract(out[:, 1], tmp, out=out[:, 1])
+    out[:, 0] = v_r
+    out[:, 2] = vec[:, 2]
+
+
+def cylindrical_to_cartesian(grid, vec=None, out=None):
     r"""Transform from cylindrical to cartesian coordinates.
 
     Transform a grid or a vector from cylindrical coordinates :math:`(r, \theta, z)` to
@@ -18,12 +190,22 @@ def cylindrical_to_cartesian(grid, vec=None):
         Vector defined in cylindrical coordinates :math:`(r, \theta, z)` at the
         locations grid. Will also except a flattend array in column major order with the
         same number of elements.
+    out : (n, 3) numpy.ndarray, optional
+        An array to store the result in, avoiding a new allocation. It must have the
+        dtype of the result (see Notes), and may be the same array as `grid` or `vec`
+        to transform them in place.
 
     Returns
     -------
     (n, 3) numpy.ndarray
         If `vec` is ``None``, this returns the transformed `grid` array, otherwise
-        this is the transformed `vec` array.
+        this is the transformed `vec` array. If `out` was given, it is returned.
+
+    Notes
+    -----
+    The transform is computed in float32 if all of the inputs are float32, which
+    halves the memory traffic when double precision is not needed (e.g. for
+    visualization). Otherwise it is computed in float64.
 
     Examples
     --------
@@ -64,44 +246,51 @@ def cylindrical_to_cartesian(grid, vec=None):
            [ 7.07106781e-01, -7.07106781e-01,  3.00000000e+00],
            [ 1.00000000e+00, -2.44929360e-16,  4.00000000e+00]])
     """
+    if vec is None and isinstance(grid, np.ndarray) and grid.shape == (3,):
+        # single point, skip the array machinery entirely
+        r, t, z = grid.tolist()
+        out = _prepare_out(out, (1, 3), _result_dtype(grid))
+        out[0] = r * math.cos(t), r * math.sin(t), z
+        return out
+
     grid = np.atleast_2d(grid)
+    n_pts, dim = grid.shape
 
-    if vec is None:
-        return np.hstack(
-            [
-                mkvc(grid[:, 0] * np.cos(grid[:, 1]), 2),
-                mkvc(grid[:, 0] * np.sin(grid[:, 1]), 2),
-                mkvc(grid[:, 2], 2),
-            ]
-        )
-    vec = np.asanyarray(vec)
-    if len(vec.shape) == 1 or vec.shape[1] == 1:
-        vec = vec.reshape(grid.shape, order="F")
-
-    x = vec[:, 0] * np.cos(grid[:, 1]) - vec[:, 1] * np.sin(grid[:, 1])
-    y = vec[:, 0] * np.sin(grid[:, 1]) + vec[:, 1] * np.cos(grid[:, 1])
-
-    newvec = [x, y]
-    if grid.shape[1] == 3:
-        z = vec[:, 2]
-        newvec += [z]
+    if vec is not None:
+        vec = np.asanyarray(vec)
+        if len(vec.shape) == 1 or vec.shape[1] == 1:
+            vec = vec.reshape(grid.shape, order="F")
+        vec = _broadcast_vec(vec, n_pts, dim)
+
+    dtype = _result_dtype(grid, vec)
+    out = _prepare_out(out, (n_pts, 3 if vec is None else dim), dtype)
 
-    return np.vstack(newvec).T
+    kernels = _compiled_kernels(grid, dtype)
+    if kernels is not None and out.flags.c_contiguous:
+        grid = np.ascontiguousarray(grid, dtype=dtype)
+        if vec is None:
+            kernels._cyl2cart_pts(grid, out)
+        else:
+            vec = np.ascontiguousarray(vec, dtype=dtype)
+            kernels._cyl2cart_vec(grid, vec, out)
+        return out
 
+    return _apply_tiled(_cyl2cart_numpy, grid, vec, out)
 
-def cyl2cart(grid, vec=None):
+
+def cyl2cart(grid, vec=None, out=None):
     """Transform from cylindrical to cartesian coordinates.
 
-    An alias for `cylindrical_to_cartesian``.
+    An alias for `cylindrical_to_cartesian`.
 
     See Also
     --------
     cylindrical_to_cartesian
     """
-    return cylindrical_to_cartesian(grid, vec)
+    return cylindrical_to_cartesian(grid, vec, out=out)
 
 
-def cartesian_to_cylindrical(grid, vec=None):
+def cartesian_to_cylindrical(grid, vec=None, out=None):
     r"""Transform from cartesian to cylindrical coordinates.
 
     Transform a grid or a vector from Cartesian coordinates :math:`(x, y, z)` to
@@ -114,12 +303,22 @@ def cartesian_to_cylindrical(grid, vec=None):
     vec : (n, 3) array_like, optional
         Vector defined in Cartesian coordinates. This also accepts a flattened array
         with the same total elements in column major order.
+    out : (n, 3) numpy.ndarray, optional
+        An array to store the result in, avoiding a new allocation. It must have the
+        dtype of the result (see Notes), and may be the same array as `grid` or `vec`
+        to transform them in place.
 
     Returns
     -------
     (n, 3) numpy.ndarray
         If `vec` is ``None``, this returns the transformed `grid` array, otherwise
-        this is the transformed `vec` array.
+        this is the transformed `vec` array. If `out` was given, it is returned.
+
+    Notes
+    -----
+    The transform is computed in float32 if all of the inputs are float32, which
+    halves the memory traffic when double precision is not needed (e.g. for
+    visualization). Otherwise it is computed in float64.
 
     Examples
     --------
@@ -162,31 +361,43 @@ def cartesian_to_cylindrical(grid, vec=None):
            [ 1.00000000e+00, -7.85398163e-01,  3.00000000e+00],
            [ 1.00000000e+00, -2.44929360e-16,  4.00000000e+00]])
     """
+    if vec is None and isinstance(grid, np.ndarray) and grid.shape == (3,):
+        # single point, skip the array machinery entirely
+        x, y, z = grid.tolist()
+        out = _prepare_out(out, (1, 3), _result_dtype(grid))
+        out[0] = math.hypot(x, y), math.atan2(y, x), z
+        return out
+
     grid = as_array_n_by_dim(grid, 3)
-    theta = np.arctan2(grid[:, 1], grid[:, 0])
-    if vec is None:
-        return np.c_[np.linalg.norm(grid[:, :2], axis=-1), theta, grid[:, 2]]
-    vec = as_array_n_by_dim(vec, 3)
+    if vec is not None:
+        vec = _broadcast_vec(as_array_n_by_dim(vec, 3), grid.shape[0], 3)
 
-    return np.hstack(
-        [
-            mkvc(np.cos(theta) * vec[:, 0] + np.sin(theta) * vec[:, 1], 2),
-            mkvc(-np.sin(theta) * vec[:, 0] + np.cos(theta) * vec[:, 1], 2),
-            mkvc(vec[:, 2], 2),
-        ]
-    )
+    dtype = _result_dtype(grid, vec)
+    out = _prepare_out(out, (grid.shape[0], 3), dtype)
+
+    kernels = _compiled_kernels(grid, dtype)
+    if kernels is not None and out.flags.c_contiguous:
+        grid = np.ascontiguousarray(grid, dtype=dtype)
+        if vec is None:
+            kernels._cart2cyl_pts(grid, out)
+        else:
+            vec = np.ascontiguousarray(vec, dtype=dtype)
+            kernels._cart2cyl_vec(grid, vec, out)
+        return out
 
+    return _apply_tiled(_cart2cyl_numpy, grid, vec, out)
 
-def cart2cyl(grid, vec=None):
+
+def cart2cyl(grid, vec=None, out=None):
     """Transform from cartesian to cylindrical coordinates.
 
-    An alias for cartesian_to_cylindrical
+    An alias for `cartesian_to_cylindrical`.
 
     See Also
     --------
     cartesian_to_cylindrical
     """
-    return cartesian_to_cylindrical(grid, vec)
+    return cartesian_to_cylindrical(grid, vec, out=out)
 
 
 def rotation_matrix_from_normals(v0, v1, tol=1e-20):
@@ -210,49 +421,242 @@ def rotation_matrix_from_normals(v0, v1, tol=1e-20):
         Finishing orientation direction
     tol : float, optional
         Numerical tolerance. If the length of the rotation axis is below this value,
-        it is assumed to be no rotation, and an identity matrix is returned.
+        the vectors are assumed to be parallel. An identity matrix is returned if
+        they point in the same direction, and a half turn about an axis
+        perpendicular to v0 if they point in opposite directions.
 
     Returns
     -------
     (3, 3) numpy.ndarray
         The rotation matrix from v0 to v1.
     """
+    return _rotation_matrix_from_normals(v0, v1, tol)[0]
+
+
+def _half_turn(a0, a1, a2):
+    """Rotation by 180 degrees about an axis perpendicular to the unit vector a."""
+    # cross a with the coordinate axis it is least aligned with
+    if abs(a0) <= abs(a1) and abs(a0) <= abs(a2):
+        u0, u1, u2 = 0.0, a2, -a1
+    elif abs(a1) <= abs(a2):
+        u0, u1, u2 = -a2, 0.0, a0
+    else:
+        u0, u1, u2 = a1, -a0, 0.0
+    norm_u = math.hypot(u0, u1, u2)
+    u = np.array([u0, u1, u2]) / norm_u
+    return 2.0 * np.outer(u, u) - np.eye(3)
+
+
+def _rotation_matrix_from_normals(v0, v1, tol=1e-20):
+    """Implement rotation_matrix_from_normals, also flagging identity rotations.
+
+    Returns
+    -------
+    R : (3, 3) numpy.ndarray
+        The rotation matrix from v0 to v1.
+    is_identity : bool
+        Whether `R` is the identity, so applying it can be skipped.
+    """
     # ensure both v0, v1 are vectors of length 1
     if len(v0) != 3:
         raise ValueError("Length of n0 should be 3")
     if len(v1) != 3:
         raise ValueError("Length of n1 should be 3")
 
-    # ensure both are true normals
-    n0 = v0 * 1.0 / np.linalg.norm(v0)
-    n1 = v1 * 1.0 / np.linalg.norm(v1)
+    # ensure both are true normals. These are only 3-vectors, so scalar math is
+    # much cheaper than dispatching numpy's norm, cross and dot.
+    a0, a1, a2 = np.asarray(v0, dtype=float).ravel().tolist()
+    b0, b1, b2 = np.asarray(v1, dtype=float).ravel().tolist()
+    # hypot scales its arguments, so tiny normals do not underflow to zero
+    norm_a = math.hypot(a0, a1, a2)
+    norm_b = math.hypot(b0, b1, b2)
+    if norm_a == 0.0:
+        raise ValueError("v0 should have a non-zero length")
+    if norm_b == 0.0:
+        raise ValueError("v1 should have a non-zero length")
+    a0, a1, a2 = a0 / norm_a, a1 / norm_a, a2 / norm_a
+    b0, b1, b2 = b0 / norm_b, b1 / norm_b, b2 / norm_b
+
+    # the unnormalized rotation axis, with length sin(theta)
+    k0 = a1 * b2 - a2 * b1
+    k1 = a2 * b0 - a0 * b2
+    k2 = a0 * b1 - a1 * b0
+    cosT = a0 * b0 + a1 * b1 + a2 * b2
+    # compare the squared length against tol**2 to avoid the sqrt
+    sinT2 = k0 * k0 + k1 * k1 + k2 * k2
+
+    if sinT2 < tol * tol:
+        if cosT > 0.0:
+            return np.eye(3, dtype=float), True
+        # antiparallel, any axis perpendicular to v0 works
+        return _half_turn(a0, a1, a2), False
+
+    # With K the skew-symmetric cross product matrix of the axis, Rodrigues'
+    # formula is R = I + K + f K @ K with f = (1 - cos(theta)) / sin(theta)**2.
+    # Since K @ K = k k^T - sin(theta)**2 I, this expands to
+    # R = cos(theta) I + K + f k k^T, which is filled in entry by entry.
+    f = (1.0 - cosT) / sinT2
+    fk0, fk1, fk2 = f * k0, f * k1, f * k2
+    R = np.array(
+        [
+            cosT + fk0 * k0,
+            fk0 * k1 - k2,
+            fk0 * k2 + k1,
+            fk1 * k0 + k2,
+            cosT + fk1 * k1,
+            fk1 * k2 - k0,
+            fk2 * k0 - k1,
+            fk2 * k1 + k0,
+            cosT + fk2 * k2,
+        ],
+        dtype=float,
+    ).reshape(3, 3)
+    return R, False
+
 
-    n0dotn1 = n0.dot(n1)
+def rotation_matrices_from_normals(v0, v1, tol=1e-20):
+    r"""Generate a stack of 3x3 rotation matrices from pairs of vectors.
 
-    # define the rotation axis, which is the cross product of the two vectors
+    This is the batched version of :func:`rotation_matrix_from_normals`. The
+    i'th matrix :math:`\mathbf{A_i}` defines the rotation going from vector
+    :math:`\mathbf{v_{0,i}}` to vector :math:`\mathbf{v_{1,i}}`, such that:
+
+    .. math::
+        \mathbf{A_i v_{0,i}} = \mathbf{v_{1,i}}
+
+    Parameters
+    ----------
+    v0 : (n, 3) numpy.ndarray
+        Starting orientation directions. A single (3) vector is broadcast
+        against `v1`.
+    v1 : (n, 3) numpy.ndarray
+        Finishing orientation directions. A single (3) vector is broadcast
+        against `v0`.
+    tol : float, optional
+        Numerical tolerance. If the length of a rotation axis is below this value,
+        that pair is assumed to be parallel. An identity matrix is returned if they
+        point in the same direction, and a half turn about an axis perpendicular to
+        v0 if they point in opposite directions.
+
+    Returns
+    -------
+    (n, 3, 3) numpy.ndarray
+        The rotation matrices from each v0 to v1.
+
+    See Also
+    --------
+    rotation_matrix_from_normals
+    """
+    v0 = np.atleast_2d(v0)
+    v1 = np.atleast_2d(v1)
+    if v0.shape[1] != 3:
+        raise ValueError("v0 should be an n x 3 array")
+    if v1.shape[1] != 3:
+        raise ValueError("v1 should be an n x 3 array")
+    v0, v1 = np.broadcast_arrays(v0, v1)
+    n_vecs = v0.shape[0]
+
+    # ensure both are true normals, using hypot so tiny normals do not underflow
+    norm0 = np.hypot(np.hypot(v0[:, 0], v0[:, 1]), v0[:, 2])
+    norm1 = np.hypot(np.hypot(v1[:, 0], v1[:, 1]), v1[:, 2])
+    if np.any(norm0 == 0.0):
+        raise ValueError("v0 should not contain zero-length vectors")
+    if np.any(norm1 == 0.0):
+        raise ValueError("v1 should not contain zero-length vectors")
+    n0 = v0 / norm0[:, None]
+    n1 = v1 / norm1[:, None]
+
+    # the unnormalized rotation axes, with lengths sin(theta)
     rotAx = np.cross(n0, n1)
+    cosT = np.einsum("ij,ij->i", n0, n1)
+    sinT2 = np.einsum("ij,ij->i", rotAx, rotAx)
+
+    ux = np.zeros((n_vecs, 3, 3))
+    ux[:, 0, 1] = -rotAx[:, 2]
+    ux[:, 0, 2] = rotAx[:, 1]
+    ux[:, 1, 0] = rotAx[:, 2]
+    ux[:, 1, 2] = -rotAx[:, 0]
+    ux[:, 2, 0] = -rotAx[:, 1]
+    ux[:, 2, 1] = rotAx[:, 0]
+
+    # pairs with no rotation have a (near) zero skew matrix, so zeroing the
+    # scale factor of its square leaves an identity matrix.
+    no_rot = sinT2 < tol * tol
+    scale = np.divide(1.0 - cosT, sinT2, out=np.zeros(n_vecs), where=~no_rot)
+    ux[no_rot] = 0.0
+
+    R = np.eye(3) + ux + scale[:, None, None] * (ux @ ux)
+
+    # antiparallel pairs are a half turn about any axis perpendicular to v0
+    flip = no_rot & (cosT < 0.0)
+    if np.any(flip):
+        n_flip = n0[flip]
+        # cross with the coordinate axis each is least aligned with
+        least = np.eye(3)[np.argmin(np.abs(n_flip), axis=1)]
+        u = np.cross(n_flip, least)
+        u /= np.linalg.norm(u, axis=1, keepdims=True)
+        R[flip] = 2.0 * u[:, :, None] * u[:, None, :] - np.eye(3)
+    return R
+
+
+def compose_rotations(*rotation_matrices):
+    r"""Compose a sequence of rotation matrices into a single rotation.
+
+    This returns the matrix product
+    :math:`\mathbf{R} = \mathbf{R_1 R_2 \cdots R_k}` of the given matrices, so the
+    last matrix is the first rotation applied to a point. Rotating a set of
+    points once by the composed matrix avoids materializing an intermediate
+    (n, 3) array for each rotation in the sequence, which is much cheaper than
+    rotating the points by each matrix in turn when there are more than a few
+    hundred points.
 
-    if np.linalg.norm(rotAx) < tol:
-        return np.eye(3, dtype=float)
+    Parameters
+    ----------
+    *rotation_matrices : (3, 3) or (n, 3, 3) numpy.ndarray
+        The rotation matrices to compose. Stacks of matrices are broadcast
+        against each other.
 
-    rotAx *= 1.0 / np.linalg.norm(rotAx)
+    Returns
+    -------
+    (3, 3) or (n, 3, 3) numpy.ndarray
+        The composed rotation matrix.
 
-    cosT = n0dotn1 / (np.linalg.norm(n0) * np.linalg.norm(n1))
-    sinT = np.sqrt(1.0 - n0dotn1**2)
+    See Also
+    --------
+    rotation_matrix_from_normals
+    rotation_matrices_from_normals
 
-    ux = np.array(
-        [
-            [0.0, -rotAx[2], rotAx[1]],
-            [rotAx[2], 0.0, -rotAx[0]],
-            [-rotAx[1], rotAx[0], 0.0],
-        ],
-        dtype=float,
-    )
+    Examples
+    --------
+    Rotate from the z direction to the x direction, then from the x direction
+    to the y direction. The composed rotation takes the z direction to the y
+    direction.
 
-    return np.eye(3, dtype=float) + sinT * ux + (1.0 - cosT) * (ux.dot(ux))
+    >>> from discretize.utils import compose_rotations, rotation_matrix_from_normals
+    >>> import numpy as np
+    >>> R_zx = rotation_matrix_from_normals([0, 0, 1], [1, 0, 0])
+    >>> R_xy = rotation_matrix_from_normals([1, 0, 0], [0, 1, 0])
+    >>> R = compose_rotations(R_xy, R_zx)
+    >>> R @ [0, 0, 1]
+    array([0., 1., 0.])
+
+    The composed matrix can then be applied to all points in a single
+    product.
+
+    >>> xyz = np.random.rand(1000, 3)
+    >>> np.allclose(xyz @ R.T, (xyz @ R_zx.T) @ R_xy.T)
+    True
+    """
+    if len(rotation_matrices) == 0:
+        raise ValueError("At least one rotation matrix must be given")
+    rotation_matrices = [np.asarray(R) for R in rotation_matrices]
+    for R in rotation_matrices:
+        if R.shape[-2:] != (3, 3):
+            raise ValueError(f"Rotation matrices should be 3 x 3, not {R.shape}")
+    return reduce(np.matmul, rotation_matrices)
 
 
-def rotate_points_from_normals(xyz, v0, v1, x0=np.r_[0.0, 0.0, 0.0]):
+def rotate_points_from_normals(xyz, v0, v1, x0=np.r_[0.0, 0.0, 0.0], out=None):
     r"""Rotate a set of xyz locations about a specified point.
 
     Rotate a grid of Cartesian points about a location x0 according to the
@@ -270,30 +674,65 @@ def rotate_points_from_normals(xyz, v0, v1, x0=np.r_[0.0, 0.0, 0.0]):
     ----------
     xyz : (n, 3) numpy.ndarray
         locations to rotate
-    v0 : (3) numpy.ndarray
-        Starting orientation direction
-    v1 : (3) numpy.ndarray
-        Finishing orientation direction
+    v0 : (3) or (n, 3) numpy.ndarray
+        Starting orientation direction. If given as an (n, 3) array, each point is
+        rotated by its own rotation.
+    v1 : (3) or (n, 3) numpy.ndarray
+        Finishing orientation direction. If given as an (n, 3) array, each point is
+        rotated by its own rotation.
     x0 : (3) numpy.ndarray, optional
         The origin of rotation.
+    out : (n, 3) numpy.ndarray, optional
+        An array to store the rotated locations in, avoiding a new allocation. It
+        must have the dtype of the result, float32 if `xyz` is float32 and float64
+        otherwise, and may be the same array as `xyz` to rotate it in place.
 
     Returns
     -------
     (n, 3) numpy.ndarray
-        The rotated xyz locations.
+        The rotated xyz locations. If `out` was given, it is returned.
     """
+    v0 = np.asarray(v0)
+    v1 = np.asarray(v1)
+    batched = v0.ndim == 2 or v1.ndim == 2
+
     # Compute rotation matrix between v0 and v1
-    R = rotation_matrix_from_normals(v0, v1)
+    if batched:
+        R = rotation_matrices_from_normals(v0, v1)
+        if R.shape[0] != xyz.shape[0]:
+            raise ValueError(
+                "v0 and v1 should have one row for each point in xyz, "
+                f"got {R.shape[0]} rotations for {xyz.shape[0]} points"
+            )
+    else:
+        R, is_identity = _rotation_matrix_from_normals(v0, v1)
 
     if xyz.shape[1] != 3:
         raise ValueError("Grid of xyz points should be n x 3")
     if len(x0) != 3:
         raise ValueError("x0 should have length 3")
 
-    # Define origin
-    X0 = np.ones([xyz.shape[0], 1]) * mkvc(x0)
-
-    return (xyz - X0).dot(R.T) + X0  # equivalent to (R*(xyz - X0)).T + X0
+    # Define origin, broadcast against each point
+    dtype = _result_dtype(xyz)
+    x0 = np.asarray(x0, dtype=dtype).reshape(-1)
+    xyz = np.ascontiguousarray(xyz)
+    R = R.astype(dtype, copy=False)
+
+    out = _prepare_out(out, xyz.shape, dtype)
+
+    if not batched and is_identity:
+        # nothing to rotate, skip the matmul entirely
+        out[...] = xyz
+        return out
+
+    if batched:
+        np.einsum("nij,nj->ni", R, xyz - x0, out=out)
+    else:
+        # materialize the (tiny) transpose so gemm sees two C-contiguous operands
+        Rt = np.ascontiguousarray(R.T)
+        np.matmul(xyz - x0, Rt, out=out)  # equivalent to (R*(xyz - x0)).T
+    out += x0
+    return out
 
 
 rotationMatrixFromNormals = deprecate_function(
@@ -1,6 +1,6 @@
 """Functions for working with curvilinear meshes."""
 import numpy as np
-from discretize.utils.matrix_utils import mkvc, ndgrid, sub2ind
+from discretize.utils.matrix_utils import ndgrid, sub2ind
 from discretize.utils.code_utils import deprecate_function
 
 
@@ -480,7 +480,7 @@ def face_info(xyz, A, B, C, D, average=True, normalize_normals=True, **kwargs):
         return np.sqrt(x[:, 0] ** 2 + x[:, 1] ** 2 + x[:, 2] ** 2)
 
     def normalize(x):
-        return x / np.kron(np.ones((1, x.shape[1])), mkvc(length(x), 2))
+        return x / length(x)[:, None]
 
     if average:
         # average the normals at each vertex.
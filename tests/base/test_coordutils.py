@@ -0,0 +1,285 @@
+import numpy as np
+import pytest
+
+from discretize.utils import (
+    coordinate_utils,
+    cylindrical_to_cartesian,
+    cartesian_to_cylindrical,
+    rotation_matrix_from_normals,
+    rotation_matrices_from_normals,
+    rotate_points_from_normals,
+    compose_rotations,
+)
+
+TRANSFORMS = [cylindrical_to_cartesian, cartesian_to_cylindrical]
+
+
+@pytest.fixture(params=["numba", "cython", "numpy"])
+def backend(request, monkeypatch):
+    """Restrict the coordinate transforms to a single implementation."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+    elif request.param == "cython" and not coordinate_utils._CYTHON_AVAILABLE:
+        pytest.skip("cython kernels are not built")
+    monkeypatch.setattr(coordinate_utils, "_NUMBA_AVAILABLE", request.param == "numba")
+    monkeypatch.setattr(
+        coordinate_utils,
+        "_CYTHON_AVAILABLE",
+        request.param == "cython" and coordinate_utils._CYTHON_AVAILABLE,
+    )
+    return request.param
+
+
+def _random_grid(n, dtype=np.float64, seed=0):
+    rng = np.random.default_rng(seed)
+    grid = rng.random((n, 3)) * [2.0, 2 * np.pi, 3.0] - [1.0, np.pi, 1.5]
+    return grid.astype(dtype)
+
+
+@pytest.mark.parametrize(
+    "n", [coordinate_utils._NUMBA_MIN_PTS - 1, coordinate_utils._NUMBA_MIN_PTS, 20000]
+)
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_numba_matches_numpy(n, transform, monkeypatch):
+    pytest.importorskip("numba")
+    monkeypatch.setattr(coordinate_utils, "_CYTHON_AVAILABLE", False)
+    grid = _random_grid(n)
+    vec = _random_grid(n, seed=1)
+    compiled = transform(grid), transform(grid, vec)
+
+    monkeypatch.setattr(coordinate_utils, "_NUMBA_AVAILABLE", False)
+    expected = transform(grid), transform(grid, vec)
+
+    np.testing.assert_allclose(compiled[0], expected[0], rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(compiled[1], expected[1], rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_transform_out_aliasing(transform, backend):
+    grid = _random_grid(20000)
+    vec = _random_grid(20000, seed=1)
+
+    expected = transform(grid)
+    aliased = grid.copy()
+    assert transform(aliased, out=aliased) is aliased
+    np.testing.assert_allclose(aliased, expected)
+
+    expected = transform(grid, vec)
+    aliased = grid.copy()
+    np.testing.assert_allclose(transform(aliased, vec, out=aliased), expected)
+    aliased = vec.copy()
+    np.testing.assert_allclose(transform(grid, aliased, out=aliased), expected)
+
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_transform_float32(transform, backend):
+    grid = _random_grid(20000, dtype=np.float32)
+    vec = _random_grid(20000, dtype=np.float32, seed=1)
+    for out in [transform(grid), transform(grid, vec)]:
+        assert out.dtype == np.float32
+
+    expected = transform(grid.astype(np.float64), vec.astype(np.float64))
+    np.testing.assert_allclose(transform(grid, vec), expected, rtol=1e-4, atol=1e-4)
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.int16, np.uint8, np.float16])
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_transform_small_dtypes_use_float64(transform, dtype, backend):
+    grid = (_random_grid(20000) * 10).astype(dtype)
+    expected = transform(grid.astype(np.float64))
+    out = transform(grid)
+    assert out.dtype == np.float64
+    np.testing.assert_allclose(out, expected)
+
+    # a float32 vec does not pull the result down to float32 either
+    vec = _random_grid(20000, dtype=np.float32)
+    assert transform(grid, vec).dtype == np.float64
+
+
+def test_cart2cyl_vec_special_points(backend):
+    grid = _random_grid(20000)
+    # points on the axis and at infinity
+    grid[:5, :2] = [[0, 0], [np.inf, 0], [-np.inf, np.inf], [3, -np.inf], [0, np.inf]]
+    vec = _random_grid(20000, seed=1)
+
+    theta = np.arctan2(grid[:, 1], grid[:, 0])
+    c, s = np.cos(theta), np.sin(theta)
+    expected = np.c_[
+        c * vec[:, 0] + s * vec[:, 1], -s * vec[:, 0] + c * vec[:, 1], vec[:, 2]
+    ]
+    out = cartesian_to_cylindrical(grid, vec)
+    np.testing.assert_allclose(out, expected, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_transform_bad_vec_shape(transform, backend):
+    grid = _random_grid(20000)
+    with pytest.raises(ValueError):
+        transform(grid, np.ones((19999, 3)))
+    with pytest.raises(ValueError):
+        transform(grid, np.ones((20000, 2)))
+
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+def test_transform_broadcast_vec(transform, backend):
+    # spans several tiles of the numpy implementation
+    n = 2 * coordinate_utils._TILE_SIZE + 5
+    grid = _random_grid(n)
+    vec = np.array([[1.0, 2.0, 3.0]])
+    expected = transform(grid, np.repeat(vec, n, axis=0))
+    np.testing.assert_allclose(transform(grid, vec), expected)
+
+
+@pytest.mark.parametrize(
+    "v0", [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [1.0, -2.0, 3.0]]
+)
+def test_rotation_antiparallel(v0):
+    v0 = np.array(v0)
+    n0 = v0 / np.linalg.norm(v0)
+    for R in [
+        rotation_matrix_from_normals(v0, -2 * v0),
+        rotation_matrices_from_normals(v0, -2 * v0)[0],
+    ]:
+        np.testing.assert_allclose(R @ n0, -n0, atol=1e-15)
+        np.testing.assert_allclose(R @ R.T, np.eye(3), atol=1e-15)
+        np.testing.assert_allclose(np.linalg.det(R), 1.0)
+
+
+def test_rotation_matrices_match_single():
+    rng = np.random.default_rng(0)
+    v0 = rng.standard_normal((50, 3))
+    v1 = rng.standard_normal((50, 3))
+    # include parallel and antiparallel pairs
+    v1[10] = 3 * v0[10]
+    v1[20] = -0.5 * v0[20]
+
+    Rs = rotation_matrices_from_normals(v0, v1)
+    for i in range(50):
+        np.testing.assert_allclose(
+            Rs[i], rotation_matrix_from_normals(v0[i], v1[i]), atol=1e-14
+        )
+
+
+def test_rotation_tiny_and_zero_normals():
+    np.testing.assert_allclose(
+        rotation_matrix_from_normals([1e-200, 0, 0], [0, 1e-200, 0]),
+        rotation_matrix_from_normals([1, 0, 0], [0, 1, 0]),
+    )
+    np.testing.assert_allclose(
+        rotation_matrices_from_normals([1e-200, 0, 0], [0, 1e-200, 0])[0],
+        rotation_matrix_from_normals([1, 0, 0], [0, 1, 0]),
+    )
+    for func in [rotation_matrix_from_normals, rotation_matrices_from_normals]:
+        with pytest.raises(ValueError):
+            func([0, 0, 0], [1, 0, 0])
+        with pytest.raises(ValueError):
+            func([1, 0, 0], [0, 0, 0])
+
+
+def test_compose_rotations():
+    R_zx = rotation_matrix_from_normals([0, 0, 1], [1, 0, 0])
+    R_xy = rotation_matrix_from_normals([1, 0, 0], [0, 1, 0])
+
+    # the last matrix is applied first
+    R = compose_rotations(R_xy, R_zx)
+    np.testing.assert_allclose(R, R_xy @ R_zx)
+    np.testing.assert_allclose(R @ [0, 0, 1], [0, 1, 0], atol=1e-15)
+    np.testing.assert_allclose(
+        compose_rotations(R_zx, R_xy) @ [0, 0, 1], [1, 0, 0], atol=1e-15
+    )
+
+    # stacks of rotations broadcast against a single rotation
+    rng = np.random.default_rng(0)
+    Rs = rotation_matrices_from_normals(
+        rng.standard_normal((10, 3)), rng.standard_normal((10, 3))
+    )
+    composed = compose_rotations(Rs, R_zx)
+    assert composed.shape == (10, 3, 3)
+    composed_left = compose_rotations(R_zx, Rs)
+    for i in range(10):
+        np.testing.assert_allclose(composed[i], Rs[i] @ R_zx)
+        np.testing.assert_allclose(composed_left[i], R_zx @ Rs[i])
+
+
+def test_compose_rotations_errors():
+    with pytest.raises(ValueError):
+        compose_rotations()
+    with pytest.raises(ValueError):
+        compose_rotations(np.eye(3), np.eye(2))
+    with pytest.raises(ValueError):
+        compose_rotations(np.ones((4, 3)))
+
+
+def test_rotate_points_batched():
+    rng = np.random.default_rng(0)
+    xyz = rng.random((40, 3))
+    v0 = rng.standard_normal((40, 3))
+    v1 = rng.standard_normal((40, 3))
+    x0 = np.array([0.5, -1.0, 2.0])
+
+    out = rotate_points_from_normals(xyz, v0, v1, x0)
+    for i in range(40):
+        np.testing.assert_allclose(
+            out[i],
+            rotate_points_from_normals(xyz[i : i + 1], v0[i], v1[i], x0)[0],
+            rtol=1e-14,
+            atol=1e-14,
+        )
+
+    with pytest.raises(ValueError):
+        rotate_points_from_normals(xyz, v0[:-1], v1[:-1], x0)
+
+
+def test_rotate_points_parallel_normals():
+    rng = np.random.default_rng(0)
+    xyz = rng.random((100, 3))
+    v, x0 = np.array([1.0, 2.0, 3.0]), [0.5, 0.5, 0.5]
+
+    # parallel normals skip the rotation, so the points come back exactly
+    out = rotate_points_from_normals(xyz, v, 2 * v, x0)
+    np.testing.assert_array_equal(out, xyz)
+    assert not np.shares_memory(out, xyz)
+
+    aliased = xyz.copy()
+    assert rotate_points_from_normals(aliased, v, 2 * v, x0, out=aliased) is aliased
+    np.testing.assert_array_equal(aliased, xyz)
+
+
+def test_rotate_points_out():
+    rng = np.random.default_rng(0)
+    xyz = rng.random((100, 3))
+    v0, v1, x0 = [1.0, 2.0, 3.0], [-1.0, 0.5, 2.0], [0.5, 0.5, 0.5]
+    expected = rotate_points_from_normals(xyz, v0, v1, x0)
+
+    out = np.empty_like(xyz)
+    assert rotate_points_from_normals(xyz, v0, v1, x0, out=out) is out
+    np.testing.assert_allclose(out, expected)
+
+    aliased = xyz.copy()
+    assert rotate_points_from_normals(aliased, v0, v1, x0, out=aliased) is aliased
+    np.testing.assert_allclose(aliased, expected)
+
+
+def test_rotate_points_float32():
+    rng = np.random.default_rng(0)
+    xyz = rng.random((100, 3))
+    v0, v1, x0 = [1.0, 2.0, 3.0], [-1.0, 0.5, 2.0], [0.5, 0.5, 0.5]
+    expected = rotate_points_from_normals(xyz, v0, v1, x0)
+
+    out = rotate_points_from_normals(xyz.astype(np.float32), v0, v1, x0)
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, expected, rtol=1e-5, atol=1e-5)
+
+
+def test_rotate_points_integer():
+    rng = np.random.default_rng(0)
+    xyz = rng.integers(-3000, 3000, size=(100, 3)).astype(np.int16)
+    v0, v1, x0 = [1.0, 2.0, 3.0], [-1.0, 0.5, 2.0], [0.5, 0.5, 0.5]
+    expected = rotate_points_from_normals(xyz.astype(np.float64), v0, v1, x0)
+
+    out = rotate_points_from_normals(xyz, v0, v1, x0)
+    assert out.dtype == np.float64
+    np.testing.assert_allclose(out, expected, rtol=1e-14, atol=1e-11)
+
+    out = np.empty(xyz.shape)
+    assert rotate_points_from_normals(xyz, v0, v1, x0, out=out) is out